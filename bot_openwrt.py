@@ -1,13 +1,17 @@
 import os
 import re
+import json
+import time
 import logging
 import configparser
 import subprocess
 import asyncio
+from collections import deque
 from pathlib import Path
+from string import Template
 from telethon import TelegramClient, events, Button
 from telethon.tl.custom import Button as TelethonButton
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Union, Callable
 
 # Setup logging
 logging.basicConfig(
@@ -72,6 +76,391 @@ def load_config() -> Dict[str, Any]:
 # Load configuration
 CONFIG = load_config()
 
+# Number of records kept per plugin for /stats
+RECORD_HISTORY = 20
+
+# Plugin report templates, built once and filled from the plugins' --json records
+FOOTER = (
+    "✦✦✦✦✦ REVD.CLOUD ✦✦✦✦✦\n"
+    "  Telegram: t.me/ValltzID\n"
+    "  Instagram: revd.cloud\n"
+    "✦✦✦✦✦✦✦✦✦✦✦✦✦✦✦✦✦✦"
+)
+
+ERROR_TEMPLATE = Template("""✦✦✦✦✦ $title ✦✦✦✦✦
+
+⚠️  $error
+
+$footer""")
+
+SYSTEM_TEMPLATE = Template("""✦✦✦✦✦ SYSTEM MONITOR ✦✦✦✦✦
+
+📡 Device: $hostname
+🔧 Model: $model
+💻 System: $firmware
+⚙️ Kernel: $kernel
+🖥️ Arch: $arch Cortex-A53
+
+⏱️ Uptime: $uptime
+🌡️ Temp: $temp
+📊 CPU: $cpu
+📈 Load: $load
+🧠 Memory: $mem_used / $mem_total
+
+🌐 Network Information:
+   WAN: $wan
+   LAN: $lan
+
+🕒 $date
+
+$footer""")
+
+USERLIST_TEMPLATE = Template("""✦✦✦✦✦ CONNECTED USERS ✦✦✦✦✦
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📊 Total Devices: $total
+$devices━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+$footer""")
+
+USERLIST_DEVICE_TEMPLATE = Template("""━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Perangkat $index $icon
+IP: $ip
+Hostname: $hostname
+MAC: $mac
+Lease Time: $lease
+
+""")
+
+VNSTAT_TEMPLATE = Template("""✦✦✦✦✦ NETWORK STATS ✦✦✦✦✦
+
+📡 Interface: $interface
+
+TODAY:
+↓ Download: $today_rx
+↑ Upload:   $today_tx
+∑ Total:    $today_total
+
+THIS MONTH:
+↓ Download: $month_rx
+↑ Upload:   $month_tx
+∑ Total:    $month_total
+
+$footer""")
+
+SPEEDTEST_TEMPLATE = Template("""✦✦✦✦✦ SPEED TEST ✦✦✦✦✦
+
+📡 ISP: $isp
+
+↓ Download: $download Mbps
+↑ Upload:   $upload Mbps
+📊 Ping:     $ping ms
+
+Test provided by speedtest.net
+
+$footer""")
+
+PING_ONLINE_TEMPLATE = Template("""✦✦✦✦✦ NETWORK TEST ✦✦✦✦✦
+
+📡 Testing connection to $target...
+
+🌐 PING: $quality ($avg_ms ms)
+📊 Packet Loss: $loss%
+
+✅ CONNECTION STATUS: ONLINE
+
+$footer""")
+
+PING_OFFLINE_TEMPLATE = Template("""✦✦✦✦✦ NETWORK TEST ✦✦✦✦✦
+
+📡 Testing connection to $target...
+
+❌ $target: Connection failed
+
+⚠️ CONNECTION STATUS: OFFLINE
+💡 Suggestion: Check your internet connection
+
+$footer""")
+
+WIFI_TEMPLATE = Template("""✦✦✦✦✦ WIFI INFORMATION ✦✦✦✦✦
+
+$radios🌐 WiFi Networks:
+$networks📊 WiFi Statistics:
+$stats
+$footer""")
+
+WIFI_RADIO_TEMPLATE = Template("""📡 Radio: $name
+   Status: $status
+   Band: $band
+   Channel: $channel
+   Mode: $htmode
+
+""")
+
+WIFI_NETWORK_TEMPLATE = Template("""   • SSID: $ssid
+     Status: $status
+     Mode: $mode
+     Security: $encryption
+     Radio: $radio
+$clients
+""")
+
+FIREWALL_TEMPLATE = Template("""✦✦✦✦✦ FIREWALL STATUS ✦✦✦✦✦
+
+🔥 Firewall: $status
+
+🌐 Firewall Zones:
+$zones
+📊 Active Rules: $rules
+
+🔄 Port Forwards:
+$forwards
+🚫 Blocked Connections: $blocked
+🔗 Connection Tracking: $conntrack_count / $conntrack_max
+
+$footer""")
+
+STATS_TEMPLATE = Template("""✦✦✦✦✦ BOT STATS ✦✦✦✦✦
+
+$entries
+$footer""")
+
+STATS_ENTRY_TEMPLATE = Template("""$title: $runs run(s), last $age ago
+   $summary
+""")
+
+TITLES = {
+    'system': "SYSTEM MONITOR",
+    'userlist': "CONNECTED USERS",
+    'vnstat': "NETWORK STATS",
+    'speedtest': "SPEED TEST",
+    'ping': "NETWORK TEST",
+    'wifi': "WIFI INFORMATION",
+    'firewall': "FIREWALL STATUS",
+}
+
+DEVICE_ICONS = {
+    'pc': "💻",
+    'apple': "📱",
+    'tv': "📺",
+    'rpi': "🍓",
+}
+
+def format_duration(seconds: int) -> str:
+    """Format seconds like the plugins' uptime_str: [Nd ]HH:MM:SS."""
+    days, rest = divmod(int(seconds), 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes, secs = divmod(rest, 60)
+    prefix = f"{days}d " if days else ""
+    return f"{prefix}{hours:02d}:{minutes:02d}:{secs:02d}"
+
+def format_memory(data: Dict[str, Any]) -> str:
+    """Format used memory as 'X MB (Y%)'."""
+    total = data.get('mem_total_kb', 0)
+    used = data.get('mem_used_kb', 0)
+    percent = used * 100 / total if total else 0
+    return f"{used / 1024:.1f} MB ({percent:.0f}%)"
+
+def rate_ping(avg_ms: float) -> str:
+    """Return the quality rating for an average ping time."""
+    if avg_ms < 50:
+        return "Excellent ★★★★★"
+    if avg_ms < 100:
+        return "Good ★★★★☆"
+    if avg_ms < 150:
+        return "Fair ★★★☆☆"
+    if avg_ms < 200:
+        return "Poor ★★☆☆☆"
+    return "Very Poor ★☆☆☆☆"
+
+def render_system(data: Dict[str, Any], timestamp: float) -> str:
+    """Render a system.sh record."""
+    temp = data.get('temp_mc')
+    cpu = data.get('cpu_pct')
+    return SYSTEM_TEMPLATE.substitute(
+        hostname=data.get('hostname', "Unknown"),
+        model=data.get('model', "Unknown"),
+        firmware=data.get('firmware', "Unknown"),
+        kernel=data.get('kernel', "Unknown"),
+        arch=data.get('arch', "Unknown"),
+        uptime=format_duration(data.get('uptime', 0)),
+        temp=f"{temp / 1000:.1f}°C" if temp is not None else "N/A",
+        cpu=f"{cpu}%" if cpu is not None else "N/A",
+        load=f"{data.get('load1', 0) * 100:.0f}%",
+        mem_used=format_memory(data),
+        mem_total=f"{data.get('mem_total_kb', 0) / 1024:.1f} MB",
+        wan=data.get('wan') or "Not detected",
+        lan=data.get('lan') or "Not detected",
+        date=time.strftime("%d %b %Y | %I:%M %p", time.localtime(timestamp)),
+        footer=FOOTER
+    )
+
+def render_userlist(data: Dict[str, Any], timestamp: float) -> str:
+    """Render a userlist.sh record."""
+    devices = []
+    for index, device in enumerate(data.get('devices', []), 1):
+        hostname = device.get('hostname') or "unknown"
+        if len(hostname) > 20:
+            hostname = hostname[:20] + "..."
+        remaining = device.get('lease_remaining', 0)
+        if remaining <= 0:
+            lease = "Expired"
+        else:
+            lease = f"{remaining // 3600}h {remaining % 3600 // 60}m"
+        devices.append(USERLIST_DEVICE_TEMPLATE.substitute(
+            index=index,
+            icon=DEVICE_ICONS.get(device.get('type'), "🖥️"),
+            ip=device.get('ip', ""),
+            hostname=hostname,
+            mac=device.get('mac', ""),
+            lease=lease
+        ))
+    return USERLIST_TEMPLATE.substitute(
+        total=data.get('total', len(devices)),
+        devices="".join(devices) or "No DHCP leases found.\n",
+        footer=FOOTER
+    )
+
+def render_vnstat(data: Dict[str, Any], timestamp: float) -> str:
+    """Render a vnstat.sh record."""
+    today = data.get('today', {})
+    month = data.get('month', {})
+    return VNSTAT_TEMPLATE.substitute(
+        interface=data.get('interface', "br-lan"),
+        today_rx=today.get('rx', "0 KiB"),
+        today_tx=today.get('tx', "0 KiB"),
+        today_total=today.get('total', "0 KiB"),
+        month_rx=month.get('rx', "0 KiB"),
+        month_tx=month.get('tx', "0 KiB"),
+        month_total=month.get('total', "0 KiB"),
+        footer=FOOTER
+    )
+
+def render_speedtest(data: Dict[str, Any], timestamp: float) -> str:
+    """Render a speedtest.sh record."""
+    return SPEEDTEST_TEMPLATE.substitute(
+        isp=data.get('isp', "Unknown"),
+        download=data.get('download', 0),
+        upload=data.get('upload', 0),
+        ping=data.get('ping', 0),
+        footer=FOOTER
+    )
+
+def render_ping(data: Dict[str, Any], timestamp: float) -> str:
+    """Render a ping.sh record."""
+    target = data.get('target', "")
+    if not data.get('online'):
+        return PING_OFFLINE_TEMPLATE.substitute(target=target, footer=FOOTER)
+    avg_ms = round(data.get('avg_ms', 0))
+    return PING_ONLINE_TEMPLATE.substitute(
+        target=target,
+        quality=rate_ping(avg_ms),
+        avg_ms=avg_ms,
+        loss=data.get('loss_pct', 0),
+        footer=FOOTER
+    )
+
+def render_wifi(data: Dict[str, Any], timestamp: float) -> str:
+    """Render a wifi.sh record."""
+    radios = "".join(
+        WIFI_RADIO_TEMPLATE.substitute(
+            name=radio.get('name', ""),
+            status="🟢 ENABLED" if radio.get('enabled') else "🔴 DISABLED",
+            band=radio.get('band', "unknown"),
+            channel=radio.get('channel', "auto"),
+            htmode=radio.get('htmode', "unknown")
+        )
+        for radio in data.get('radios', [])
+    )
+    networks = "".join(
+        WIFI_NETWORK_TEMPLATE.substitute(
+            ssid=network.get('ssid', ""),
+            status="🟢 ACTIVE" if network.get('enabled') else "🔴 DISABLED",
+            mode=network.get('mode', "ap"),
+            encryption=network.get('encryption', "none"),
+            radio=network.get('radio', ""),
+            clients=f"     Clients: {network.get('clients', 'N/A')}\n" if network.get('mode') == "ap" else ""
+        )
+        for network in data.get('networks', [])
+    )
+    stats = "".join(
+        f"   • {stat['iface']}: RX {stat['rx_bytes'] // 1048576}MB, TX {stat['tx_bytes'] // 1048576}MB\n"
+        for stat in data.get('stats', [])
+    )
+    if not radios and not networks:
+        networks = "   • No WiFi interfaces found\n\n"
+    return WIFI_TEMPLATE.substitute(
+        radios=radios,
+        networks=networks,
+        stats=stats,
+        footer=FOOTER
+    )
+
+def render_firewall(data: Dict[str, Any], timestamp: float) -> str:
+    """Render a firewall.sh record."""
+    zones = "".join(
+        f"   • {zone.get('name')}: IN={zone.get('input', '')} OUT={zone.get('output', '')} FWD={zone.get('forward', '')}\n"
+        for zone in data.get('zones', [])
+    )
+    forwards = data.get('forwards', [])
+    if forwards:
+        forward_lines = f"   • {len(forwards)} port forward(s) configured\n" + "".join(
+            f"   • Port {forward['src_port']} → {forward['dest_ip']}:{forward.get('dest_port', '')}\n"
+            for forward in forwards[:5]
+            if forward.get('src_port') and forward.get('dest_ip')
+        )
+    else:
+        forward_lines = "   • No port forwards configured\n"
+    return FIREWALL_TEMPLATE.substitute(
+        status="🟢 ACTIVE" if data.get('active') else "🔴 INACTIVE",
+        zones=zones,
+        rules=data.get('rules', 0),
+        forwards=forward_lines,
+        blocked=data.get('blocked', 0),
+        conntrack_count=data.get('conntrack_count', "N/A"),
+        conntrack_max=data.get('conntrack_max', "N/A"),
+        footer=FOOTER
+    )
+
+RENDERERS: Dict[str, Callable[[Dict[str, Any], float], str]] = {
+    'system': render_system,
+    'userlist': render_userlist,
+    'vnstat': render_vnstat,
+    'speedtest': render_speedtest,
+    'ping': render_ping,
+    'wifi': render_wifi,
+    'firewall': render_firewall,
+}
+
+# One-line summaries of a stored record, used by /stats
+SUMMARIES: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    'system': lambda d: f"CPU {d.get('cpu_pct', 'N/A')}% · Load {d.get('load1', 0) * 100:.0f}% · Mem {format_memory(d)}",
+    'userlist': lambda d: f"{d.get('total', 0)} device(s) connected",
+    'vnstat': lambda d: f"Today {d.get('today', {}).get('total', '0 KiB')} · Month {d.get('month', {}).get('total', '0 KiB')}",
+    'speedtest': lambda d: f"↓ {d.get('download', 0)} Mbps · ↑ {d.get('upload', 0)} Mbps · {d.get('ping', 0)} ms",
+    'ping': lambda d: (f"{d.get('target')}: {round(d.get('avg_ms', 0))} ms, {d.get('loss_pct', 0)}% loss"
+                       if d.get('online') else f"{d.get('target')}: offline"),
+    'wifi': lambda d: f"{len(d.get('networks', []))} network(s), {sum(n.get('clients', 0) for n in d.get('networks', []))} client(s)",
+    'firewall': lambda d: f"{len(d.get('zones', []))} zone(s) · {d.get('conntrack_count', 'N/A')} connection(s)",
+}
+
+def render_record(name: str, timestamp: float, data: Dict[str, Any]) -> str:
+    """Render a plugin record with its template."""
+    if not data.get('ok', True):
+        return ERROR_TEMPLATE.substitute(
+            title=TITLES.get(name, name.upper()),
+            error=data.get('error', "Unknown error"),
+            footer=FOOTER
+        )
+
+    renderer = RENDERERS.get(name)
+    if renderer is None:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+    try:
+        return renderer(data, timestamp)
+    except (KeyError, TypeError, ValueError) as e:
+        logger.error(f"Failed to render {name} record: {str(e)}")
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
 class OpenWRTBot:
     """OpenWRT Telegram Bot class for managing and monitoring OpenWRT devices."""
     
@@ -82,6 +471,7 @@ class OpenWRTBot:
         self.admin_id = self.config['admin_id']
         self.script_dir = Path(__file__).parent / "plugins"  # Use plugins directory
         self.me = None  # Store bot user info
+        self.records: Dict[str, deque] = {}  # Latest (timestamp, data) records per plugin
         
         # Ensure plugins directory exists
         if not self.script_dir.exists():
@@ -230,10 +620,53 @@ class OpenWRTBot:
             logger.error(f"Failed to run script {script_name}: {str(e)}")
             return f"Error running {script_name}: {str(e)}"
 
+    def run_plugin(self, script_name: str, *args) -> str:
+        """Run a plugin in --json mode, store its record and return the rendered report."""
+        output = self.run_script(script_name, "--json", *args)
+        try:
+            data = json.loads(output)
+        except ValueError:
+            # Missing script, timeout or a plugin without --json support
+            return output
+        if not isinstance(data, dict):
+            return output
+
+        name = data.get('plugin', Path(script_name).stem)
+        record = (time.time(), data)
+        self.records.setdefault(name, deque(maxlen=RECORD_HISTORY)).append(record)
+        return render_record(name, *record)
+
+    def get_stats(self) -> str:
+        """Summarize stored plugin records without re-running any script."""
+        if not self.records:
+            return "No plugin results stored yet."
+
+        now = time.time()
+        entries = []
+        for name, records in self.records.items():
+            timestamp, data = records[-1]
+            summary = SUMMARIES.get(name)
+            if not data.get('ok', True):
+                line = f"⚠️ {data.get('error', 'Unknown error')}"
+            elif summary is None:
+                line = ""
+            else:
+                try:
+                    line = summary(data)
+                except (KeyError, TypeError, ValueError):
+                    line = ""
+            entries.append(STATS_ENTRY_TEMPLATE.substitute(
+                title=TITLES.get(name, name.upper()),
+                runs=len(records),
+                age=format_duration(now - timestamp),
+                summary=line
+            ))
+        return STATS_TEMPLATE.substitute(entries="\n".join(entries), footer=FOOTER)
+
     def get_overview(self) -> str:
         """Get system overview from OpenWRT device."""
         try:
-            return self.run_script("system.sh")
+            return self.run_plugin("system.sh")
         except Exception as e:
             logger.error(f"Error getting overview: {str(e)}")
             return f"Failed to get device overview: {str(e)}"
@@ -257,7 +690,7 @@ class OpenWRTBot:
     def run_speedtest(self) -> str:
         """Run internet speed test."""
         try:
-            return self.run_script("speedtest.sh")
+            return self.run_plugin("speedtest.sh")
         except Exception as e:
             logger.error(f"Speed test failed: {str(e)}")
             return f"❌ Speed test failed: {str(e)}"
@@ -266,9 +699,9 @@ class OpenWRTBot:
         """Run ping test to a specified target."""
         try:
             if target:
-                return self.run_script("ping.sh", target)
+                return self.run_plugin("ping.sh", target)
             else:
-                return self.run_script("ping.sh")
+                return self.run_plugin("ping.sh")
         except Exception as e:
             logger.error(f"Ping test failed: {str(e)}")
             return f"❌ Ping test failed: {str(e)}"
@@ -276,7 +709,7 @@ class OpenWRTBot:
     def get_network_stats(self) -> str:
         """Get network statistics using vnstat."""
         try:
-            return self.run_script("vnstat.sh")
+            return self.run_plugin("vnstat.sh")
         except Exception as e:
             logger.error(f"Network stats failed: {str(e)}")
             return f"❌ Failed to get network statistics: {str(e)}"
@@ -284,11 +717,27 @@ class OpenWRTBot:
     def get_user_list(self) -> str:
         """Get list of connected users."""
         try:
-            return self.run_script("userlist.sh")
+            return self.run_plugin("userlist.sh")
         except Exception as e:
             logger.error(f"User list failed: {str(e)}")
             return f"❌ Failed to get user list: {str(e)}"
     
+    def get_wifi_info(self) -> str:
+        """Get WiFi radios, networks and traffic."""
+        try:
+            return self.run_plugin("wifi.sh")
+        except Exception as e:
+            logger.error(f"WiFi info failed: {str(e)}")
+            return f"❌ Failed to get WiFi information: {str(e)}"
+    
+    def get_firewall_status(self) -> str:
+        """Get firewall zones, port forwards and counters."""
+        try:
+            return self.run_plugin("firewall.sh")
+        except Exception as e:
+            logger.error(f"Firewall status failed: {str(e)}")
+            return f"❌ Failed to get firewall status: {str(e)}"
+    
     def update_bot(self) -> str:
         """Update bot from GitHub repository."""
         try:
@@ -335,6 +784,9 @@ class OpenWRTBot:
                 f"`/speedtest` - Run a speed test\n"
                 f"`/ping [target]` - Ping a target  \n"
                 f"`/userlist` - List connected users\n"
+                f"`/wifi` - Get WiFi information\n"
+                f"`/firewall` - Get firewall status\n"
+                f"`/stats` - Show stored plugin results\n"
                 f"`/update` - Update bot from GitHub\n"
                 f"`/uninstall` - Uninstall the bot\n"
                 f"`/help` - Show this help message"
@@ -353,6 +805,9 @@ class OpenWRTBot:
                 f"`/speedtest` - Run a speed test\n"
                 f"`/ping [target]` - Ping a target  \n"
                 f"`/userlist` - List connected users\n"
+                f"`/wifi` - Get WiFi information\n"
+                f"`/firewall` - Get firewall status\n"
+                f"`/stats` - Show stored plugin results\n"
                 f"`/update` - Update bot from GitHub\n"
                 f"`/uninstall` - Uninstall the bot\n"
                 f"`/help` - Show this help message"
@@ -568,6 +1023,26 @@ class OpenWRTBot:
             await self.send_message(event, "👥Tunggu sebentar cik...", add_keyboard=False)
             result = self.get_user_list()
             await self.send_message(event, f"```\n{result}\n```")
+
+        @self.client.on(events.NewMessage(pattern='/wifi'))
+        async def wifi_handler(event):
+            """Handle /wifi command."""
+            await self.send_message(event, "📶 Tunggu sebentar cik...", add_keyboard=False)
+            result = self.get_wifi_info()
+            await self.send_message(event, f"```\n{result}\n```")
+
+        @self.client.on(events.NewMessage(pattern='/firewall'))
+        async def firewall_handler(event):
+            """Handle /firewall command."""
+            await self.send_message(event, "🔥 Tunggu sebentar cik...", add_keyboard=False)
+            result = self.get_firewall_status()
+            await self.send_message(event, f"```\n{result}\n```")
+
+        @self.client.on(events.NewMessage(pattern='/stats'))
+        async def stats_handler(event):
+            """Handle /stats command."""
+            result = self.get_stats()
+            await self.send_message(event, f"```\n{result}\n```")
         
         # Handle button clicks
         @self.client.on(events.NewMessage())
@@ -2,6 +2,56 @@
 
 # OpenWRT Firewall Status Script
 # REVD.CLOUD
+#
+# Usage: firewall.sh [--json]
+#   --json  print a single JSON record instead of the text report
+
+# Print zones, forwards and counters as a JSON record
+print_json() {
+    . /usr/share/libubox/jshn.sh
+    json_init
+    json_add_string plugin "firewall"
+    json_add_boolean ok 1
+    json_add_boolean active "$(pgrep -f "firewall" > /dev/null && echo 1 || echo 0)"
+
+    json_add_array zones
+    for idx in $(uci show firewall | grep -o "^firewall\.@zone\[[0-9]*\]=zone" | grep -o "[0-9]\+"); do
+        local zone_name=$(uci get firewall.@zone[$idx].name 2>/dev/null)
+        [ -z "$zone_name" ] && continue
+        json_add_object
+        json_add_string name "$zone_name"
+        json_add_string input "$(uci get firewall.@zone[$idx].input 2>/dev/null)"
+        json_add_string output "$(uci get firewall.@zone[$idx].output 2>/dev/null)"
+        json_add_string forward "$(uci get firewall.@zone[$idx].forward 2>/dev/null)"
+        json_close_object
+    done
+    json_close_array
+
+    json_add_array forwards
+    for idx in $(uci show firewall | grep -o "^firewall\.@redirect\[[0-9]*\]=redirect" | grep -o "[0-9]\+"); do
+        json_add_object
+        json_add_string src_port "$(uci get firewall.@redirect[$idx].src_dport 2>/dev/null)"
+        json_add_string dest_ip "$(uci get firewall.@redirect[$idx].dest_ip 2>/dev/null)"
+        json_add_string dest_port "$(uci get firewall.@redirect[$idx].dest_port 2>/dev/null)"
+        json_close_object
+    done
+    json_close_array
+
+    json_add_int rules "$(iptables -L | grep -c "^Chain\|^target")"
+    json_add_int blocked "$(iptables -L INPUT | grep "DROP" | wc -l)"
+
+    local conntrack_count=$(cat /proc/sys/net/netfilter/nf_conntrack_count 2>/dev/null)
+    local conntrack_max=$(cat /proc/sys/net/netfilter/nf_conntrack_max 2>/dev/null)
+    [ -n "$conntrack_count" ] && json_add_int conntrack_count "$conntrack_count"
+    [ -n "$conntrack_max" ] && json_add_int conntrack_max "$conntrack_max"
+
+    json_dump
+}
+
+if [ "$1" = "--json" ]; then
+    print_json
+    exit 0
+fi
 
 echo ""
 echo "  ✦✦✦✦✦ FIREWALL STATUS ✦✦✦✦✦"
@@ -1,9 +1,37 @@
 #!/bin/sh
 
+# Usage: ping.sh [--json] [target]
+#   --json  print a single JSON record instead of the text report
+if [ "$1" = "--json" ]; then
+    JSON=1
+    shift
+fi
+
 # Define default target if none is specified
 TARGET=${1:-"google.com"}
 PING_COUNT=4
 
+# Machine-readable record, rendered by the bot
+if [ "$JSON" = "1" ]; then
+    . /usr/share/libubox/jshn.sh
+    json_init
+    json_add_string plugin "ping"
+    json_add_boolean ok 1
+    json_add_string target "$TARGET"
+
+    ping_result=$(ping -c $PING_COUNT -W 2 "$TARGET" 2>&1)
+    if [ $? -eq 0 ]; then
+        json_add_boolean online 1
+        json_add_double avg_ms "$(echo "$ping_result" | grep "min/avg/max" | awk -F'= ' '{split($2, rtt, "/"); print rtt[2]}')"
+        json_add_int loss_pct "$(echo "$ping_result" | grep -o "[0-9]*% packet loss" | grep -o "^[0-9]*")"
+    else
+        json_add_boolean online 0
+    fi
+
+    json_dump
+    exit 0
+fi
+
 # Always ensure there's some output
 echo ""
 echo "  ✦✦✦✦✦ NETWORK TEST ✦✦✦✦✦"
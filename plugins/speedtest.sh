@@ -1,7 +1,25 @@
 #!/bin/sh
 
+# Usage: speedtest.sh [--json]
+#   --json  print a single JSON record instead of the text report
+[ "$1" = "--json" ] && JSON=1
+
+# Print a failed JSON record: <message>
+json_error() {
+    . /usr/share/libubox/jshn.sh
+    json_init
+    json_add_string plugin "speedtest"
+    json_add_boolean ok 0
+    json_add_string error "$1"
+    json_dump
+}
+
 # Check if speedtest-cli is installed
 if ! command -v speedtest-cli >/dev/null 2>&1; then
+    if [ "$JSON" = "1" ]; then
+        json_error "speedtest-cli is not installed (opkg install python3-speedtest-cli)"
+        exit 1
+    fi
     cat << EOF
 
   ✦✦✦✦✦ SPEED TEST ✦✦✦✦✦
@@ -23,6 +41,10 @@ timeout 120 speedtest-cli --simple > /tmp/speedtest_result 2>/dev/null
 SPEEDTEST_STATUS=$?
 
 if [ $SPEEDTEST_STATUS -ne 0 ]; then
+    if [ "$JSON" = "1" ]; then
+        json_error "Speed test failed, check your network connection"
+        exit 1
+    fi
     cat << EOF
 
   ✦✦✦✦✦ SPEED TEST ✦✦✦✦✦
@@ -71,6 +93,20 @@ get_isp() {
 
 ISP=$(get_isp)
 
+# Machine-readable record, rendered by the bot
+if [ "$JSON" = "1" ]; then
+    . /usr/share/libubox/jshn.sh
+    json_init
+    json_add_string plugin "speedtest"
+    json_add_boolean ok 1
+    json_add_string isp "$ISP"
+    json_add_double download "${DOWNLOAD:-0}"
+    json_add_double upload "${UPLOAD:-0}"
+    json_add_double ping "${PING:-0}"
+    json_dump
+    exit 0
+fi
+
 # Add quality rating - replace bc with awk
 if awk "BEGIN {exit !($DOWNLOAD >= 100)}"; then
     RATING="Excellent ★★★★★"
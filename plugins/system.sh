@@ -3,6 +3,12 @@
 #
 # system monitor for OpenWRT
 # REVD.CLOUD
+#
+# Usage: system.sh [--json]
+#   --json  print a single JSON record instead of the text report
+
+[ "$1" = "--json" ] && JSON=1
+
 uptime_str() { # <Time in Seconds>
     local Uptime=$1
     if [ $Uptime -gt 0 ]; then
@@ -26,22 +32,19 @@ ARCH=$(uname -m)
 FIRMWARE=$(cat /etc/openwrt_release 2>/dev/null | grep DISTRIB_DESCRIPTION | cut -d "'" -f 2 || echo "Unknown")
 PLATFORM=$(cat /etc/openwrt_release 2>/dev/null | grep DISTRIB_TARGET | cut -d "'" -f 2 || echo "Unknown")
 KERNEL=$(uname -r)
-DATE=$(date +"%d %b %Y | %I:%M %p")
-
-# Better uptime formatting
 SYS_UPTIME=$(cut -d. -f1 /proc/uptime)
-UPTIME=$(uptime_str $SYS_UPTIME)
 
-# System metrics
-TEMP=$(awk '{printf "%.1f°C", $1/1000}' /sys/class/thermal/thermal_zone0/temp 2>/dev/null || echo "N/A")
-LOAD=$(awk '{printf "%.0f%%", $1 * 100}' /proc/loadavg)
+# Raw system metrics (formatted later for the text report only)
+TEMP_RAW=$(cat /sys/class/thermal/thermal_zone0/temp 2>/dev/null)
+LOAD_RAW=$(cut -d' ' -f1 /proc/loadavg)
 
 # Fix CPU usage to only show percentage
 CPU_RAW=$(top -bn1 | grep 'CPU:' | awk '{print $2}' || echo "N/A")
 CPU=$(echo "$CPU_RAW" | grep -o "[0-9]*%" || echo "$CPU_RAW")
 
-MEM_TOTAL=$(free | grep Mem | awk '{printf "%.1f MB", $2/1024}')
-MEM_USED=$(free | grep Mem | awk '{printf "%.1f MB (%.0f%%)", $3/1024, $3*100/$2}')
+MEM_RAW=$(free | grep Mem | awk '{print $2 " " $3}')
+MEM_TOTAL_KB=${MEM_RAW% *}
+MEM_USED_KB=${MEM_RAW#* }
 
 # Get network information
 get_wan_info() {
@@ -183,6 +186,39 @@ LAN_INFO=$(get_lan_info)
 BR_LAN_INFO=$(get_br_lan_info)
 WLAN_INFO=$(get_wlan_info)
 
+# Machine-readable record, rendered by the bot
+if [ "$JSON" = "1" ]; then
+    . /usr/share/libubox/jshn.sh
+    json_init
+    json_add_string plugin "system"
+    json_add_boolean ok 1
+    json_add_string hostname "$HOSTNAME"
+    json_add_string model "$MODEL"
+    json_add_string firmware "$FIRMWARE"
+    json_add_string platform "$PLATFORM"
+    json_add_string kernel "$KERNEL"
+    json_add_string arch "$ARCH"
+    json_add_int uptime "${SYS_UPTIME:-0}"
+    [ -n "$TEMP_RAW" ] && json_add_int temp_mc "$TEMP_RAW"
+    CPU_PCT=$(echo "$CPU" | grep -o "^[0-9]*")
+    [ -n "$CPU_PCT" ] && json_add_int cpu_pct "$CPU_PCT"
+    json_add_double load1 "$LOAD_RAW"
+    json_add_int mem_total_kb "${MEM_TOTAL_KB:-0}"
+    json_add_int mem_used_kb "${MEM_USED_KB:-0}"
+    json_add_string wan "$WAN_INFO"
+    json_add_string lan "$LAN_INFO"
+    json_add_string wlan "$WLAN_INFO"
+    json_dump
+    exit 0
+fi
+
+DATE=$(date +"%d %b %Y | %I:%M %p")
+UPTIME=$(uptime_str $SYS_UPTIME)
+TEMP=$(echo "$TEMP_RAW" | awk '$1 != "" {printf "%.1f°C", $1/1000; found=1} END {if (!found) print "N/A"}')
+LOAD=$(echo "$LOAD_RAW" | awk '{printf "%.0f%%", $1 * 100}')
+MEM_TOTAL=$(echo "$MEM_RAW" | awk '{printf "%.1f MB", $1/1024}')
+MEM_USED=$(echo "$MEM_RAW" | awk '{printf "%.1f MB (%.0f%%)", $2/1024, $2*100/$1}')
+
 # Create elegant report
 cat << EOF
 
@@ -4,31 +4,47 @@
 # User List
 # REVD.CLOUD
 #
+# Usage: userlist.sh [--json]
+#   --json  print a single JSON record instead of the text report
+#
 
-# Function to determine device type icon based on MAC vendor
-get_device_icon() {
+[ "$1" = "--json" ] && JSON=1
+
+# Function to determine device type based on MAC vendor
+get_device_type() {
     local mac=$1
     local vendor=$(echo $mac | cut -d':' -f1-3 | tr 'a-z' 'A-Z')
     
     case "$vendor" in
         "00:50:56"|"00:0C:29"|"00:05:69"|"00:1C:14"|"00:1C:42")
-            echo "💻" # VMware/PC
+            echo "pc" # VMware/PC
             ;;
         "3C:22:FB"|"58:FB:84"|"AC:87:A3"|"28:CF:DA"|"04:D3:B0"|"34:2C:C4"|"98:01:A7"|"68:FB:7E"|"90:B0:ED"|"D4:38:9C")
-            echo "📱" # Apple
+            echo "apple" # Apple
             ;;
         "00:16:41"|"22:21:E9"|"C2:9F:DB")
-            echo "📺" # Smart TV
+            echo "tv" # Smart TV
             ;;
         "DC:A6:32"|"B8:27:EB"|"E4:5F:01")
-            echo "🍓" # Raspberry Pi
+            echo "rpi" # Raspberry Pi
             ;;
         *)
-            echo "🖥️" # Generic device
+            echo "generic" # Generic device
             ;;
     esac
 }
 
+# Function to determine device type icon based on MAC vendor
+get_device_icon() {
+    case "$(get_device_type $1)" in
+        pc) echo "💻" ;;
+        apple) echo "📱" ;;
+        tv) echo "📺" ;;
+        rpi) echo "🍓" ;;
+        *) echo "🖥️" ;;
+    esac
+}
+
 # Function to get the hostname from IP
 get_hostname() {
     local ip=$1
@@ -105,8 +121,48 @@ process_dhcp_leases() {
     fi
 }
 
+# Print DHCP leases as a JSON record
+print_json() {
+    . /usr/share/libubox/jshn.sh
+    json_init
+    json_add_string plugin "userlist"
+    json_add_boolean ok 1
+
+    local dhcp_count=0
+    local current_time=$(date +%s)
+    [ -f "/tmp/dhcp.leases" ] && dhcp_count=$(wc -l < /tmp/dhcp.leases)
+    json_add_int total "$dhcp_count"
+
+    json_add_array devices
+    if [ -f "/tmp/dhcp.leases" ]; then
+        while IFS=' ' read -r lease_time mac ip hostname _; do
+            [ -z "$mac" ] || [ "$mac" = "*" ] && continue
+
+            if [ -z "$hostname" ] || [ "$hostname" = "*" ]; then
+                hostname=$(get_hostname $ip)
+            fi
+
+            json_add_object
+            json_add_string ip "$ip"
+            json_add_string hostname "$hostname"
+            json_add_string mac "$mac"
+            json_add_string type "$(get_device_type $mac)"
+            json_add_int lease_remaining "$((lease_time - current_time))"
+            json_close_object
+        done < /tmp/dhcp.leases
+    fi
+    json_close_array
+
+    json_dump
+}
+
 # Main function
 main() {
+    if [ "$JSON" = "1" ]; then
+        print_json
+        return
+    fi
+
     print_header
     
     # Process DHCP leases only
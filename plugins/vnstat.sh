@@ -1,7 +1,25 @@
 #!/bin/sh
 
+# Usage: vnstat.sh [--json]
+#   --json  print a single JSON record instead of the text report
+[ "$1" = "--json" ] && JSON=1
+
+# Print a failed JSON record: <message>
+json_error() {
+    . /usr/share/libubox/jshn.sh
+    json_init
+    json_add_string plugin "vnstat"
+    json_add_boolean ok 0
+    json_add_string error "$1"
+    json_dump
+}
+
 # Check if vnstat is installed
 if ! command -v vnstat >/dev/null 2>&1; then
+    if [ "$JSON" = "1" ]; then
+        json_error "vnstat is not installed (opkg update && opkg install vnstat)"
+        exit 1
+    fi
     cat << EOF
 
   ✦✦✦✦✦ NETWORK STATS ✦✦✦✦✦
@@ -20,6 +38,10 @@ INTERFACE="br-lan"
 
 # Check if br-lan exists
 if [ ! -d "/sys/class/net/$INTERFACE" ]; then
+    if [ "$JSON" = "1" ]; then
+        json_error "Interface $INTERFACE not found"
+        exit 1
+    fi
     cat << EOF
 
   ✦✦✦✦✦ NETWORK STATS ✦✦✦✦✦
@@ -37,6 +59,12 @@ vnstat -i "$INTERFACE" -u >/dev/null 2>&1
 
 # Check if vnstat database is ready
 if ! vnstat -i "$INTERFACE" > /dev/null 2>&1; then
+    # Try to create the database
+    vnstat -i "$INTERFACE" --create >/dev/null 2>&1
+    if [ "$JSON" = "1" ]; then
+        json_error "No vnstat data for $INTERFACE yet, try again in a few minutes"
+        exit 1
+    fi
     cat << EOF
 
   ✦✦✦✦✦ NETWORK STATS ✦✦✦✦✦
@@ -53,8 +81,6 @@ if ! vnstat -i "$INTERFACE" > /dev/null 2>&1; then
   ✦✦✦✦✦ REVD.CLOUD ✦✦✦✦✦
 
 EOF
-    # Try to create the database
-    vnstat -i "$INTERFACE" --create >/dev/null 2>&1
     exit 1
 fi
 
@@ -143,6 +169,28 @@ TOTAL_RX=$(echo "$TOTAL_DATA" | cut -d';' -f1)
 TOTAL_TX=$(echo "$TOTAL_DATA" | cut -d';' -f2)
 TOTAL_SUM=$(echo "$TOTAL_DATA" | cut -d';' -f3)
 
+# Machine-readable record, rendered by the bot: <name> <rx> <tx> <total>
+json_add_usage() {
+    json_add_object "$1"
+    json_add_string rx "$2"
+    json_add_string tx "$3"
+    json_add_string total "$4"
+    json_close_object
+}
+
+if [ "$JSON" = "1" ]; then
+    . /usr/share/libubox/jshn.sh
+    json_init
+    json_add_string plugin "vnstat"
+    json_add_boolean ok 1
+    json_add_string interface "$INTERFACE"
+    json_add_usage today "$TODAY_RX" "$TODAY_TX" "$TODAY_TOTAL"
+    json_add_usage month "$MONTH_RX" "$MONTH_TX" "$MONTH_TOTAL"
+    json_add_usage all_time "$TOTAL_RX" "$TOTAL_TX" "$TOTAL_SUM"
+    json_dump
+    exit 0
+fi
+
 # Format report
 cat << EOF
 
@@ -2,6 +2,97 @@
 
 # OpenWRT WiFi Information Script
 # REVD.CLOUD
+#
+# Usage: wifi.sh [--json]
+#   --json  print a single JSON record instead of the text report
+
+# Count connected stations of an AP interface: <wifi-iface section>
+get_clients() {
+    local iface=$1
+    local mode=$(uci get wireless.$iface.mode 2>/dev/null || echo "ap")
+    local disabled=$(uci get wireless.$iface.disabled 2>/dev/null || echo "0")
+    local device=$(uci get wireless.$iface.device 2>/dev/null)
+
+    if [ "$mode" != "ap" ] || [ "$disabled" = "1" ]; then
+        echo "N/A"
+        return
+    fi
+
+    # Try to get interface name
+    local ifname=$(uci get wireless.$iface.ifname 2>/dev/null)
+    if [ -z "$ifname" ]; then
+        # Generate likely interface name
+        ifname="wlan0"
+        if [ "$device" = "radio1" ]; then
+            ifname="wlan1"
+        fi
+    fi
+
+    # Count connected stations
+    if [ -d "/sys/class/net/$ifname" ]; then
+        iw dev $ifname station dump 2>/dev/null | grep "Station" | wc -l
+    else
+        echo "N/A"
+    fi
+}
+
+# Print radios, networks and traffic as a JSON record
+print_json() {
+    . /usr/share/libubox/jshn.sh
+    json_init
+    json_add_string plugin "wifi"
+    json_add_boolean ok 1
+
+    json_add_array radios
+    for radio in $(uci show wireless | grep "wireless\.radio" | cut -d. -f2 | cut -d= -f1 | sort -u); do
+        [ "$radio" = "radio" ] && continue
+        json_add_object
+        json_add_string name "$radio"
+        json_add_boolean enabled "$([ "$(uci get wireless.$radio.disabled 2>/dev/null)" = "1" ] && echo 0 || echo 1)"
+        json_add_string band "$(uci get wireless.$radio.band 2>/dev/null || echo "unknown")"
+        json_add_string channel "$(uci get wireless.$radio.channel 2>/dev/null || echo "auto")"
+        json_add_string htmode "$(uci get wireless.$radio.htmode 2>/dev/null || echo "unknown")"
+        json_close_object
+    done
+    json_close_array
+
+    json_add_array networks
+    for iface in $(uci show wireless | grep "wireless\.@wifi-iface" | cut -d. -f2 | cut -d= -f1 | sort -u); do
+        local ssid=$(uci get wireless.$iface.ssid 2>/dev/null)
+        [ -z "$ssid" ] && continue
+        local clients=$(get_clients $iface)
+        json_add_object
+        json_add_string ssid "$ssid"
+        json_add_boolean enabled "$([ "$(uci get wireless.$iface.disabled 2>/dev/null)" = "1" ] && echo 0 || echo 1)"
+        json_add_string mode "$(uci get wireless.$iface.mode 2>/dev/null || echo "ap")"
+        json_add_string encryption "$(uci get wireless.$iface.encryption 2>/dev/null || echo "none")"
+        json_add_string radio "$(uci get wireless.$iface.device 2>/dev/null)"
+        [ "$clients" != "N/A" ] && json_add_int clients "$clients"
+        json_close_object
+    done
+    json_close_array
+
+    json_add_array stats
+    for iface in wlan0 wlan1; do
+        [ -d "/sys/class/net/$iface" ] || continue
+        local rx_bytes=$(cat /sys/class/net/$iface/statistics/rx_bytes 2>/dev/null)
+        local tx_bytes=$(cat /sys/class/net/$iface/statistics/tx_bytes 2>/dev/null)
+        [ -n "$rx_bytes" ] && [ -n "$tx_bytes" ] || continue
+        json_add_object
+        json_add_string iface "$iface"
+        json_add_int rx_bytes "$rx_bytes"
+        json_add_int tx_bytes "$tx_bytes"
+        json_close_object
+    done
+    json_close_array
+
+    json_dump
+}
+
+if [ "$1" = "--json" ]; then
+    print_json
+    exit 0
+fi
 
 echo ""
 echo "  ✦✦✦✦✦ WIFI INFORMATION ✦✦✦✦✦"
@@ -57,26 +148,7 @@ for iface in $(uci show wireless | grep "wireless\.@wifi-iface" | cut -d. -f2 |
         fi
         
         # Get connected clients for AP mode
-        if [ "$mode" = "ap" ] && [ "$disabled" != "1" ]; then
-            # Try to get interface name
-            ifname=$(uci get wireless.$iface.ifname 2>/dev/null)
-            if [ -z "$ifname" ]; then
-                # Generate likely interface name
-                ifname="wlan0"
-                if [ "$device" = "radio1" ]; then
-                    ifname="wlan1"
-                fi
-            fi
-            
-            # Count connected stations
-            if [ -d "/sys/class/net/$ifname" ]; then
-                clients=$(iw dev $ifname station dump 2>/dev/null | grep "Station" | wc -l)
-            else
-                clients="N/A"
-            fi
-        else
-            clients="N/A"
-        fi
+        clients=$(get_clients $iface)
         
         echo "     • SSID: $ssid"
         echo "       Status: $net_status"